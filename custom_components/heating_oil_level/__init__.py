@@ -1,18 +1,34 @@
 """The Heating Oil Level integration."""
 from __future__ import annotations
 
+import csv
+import json
 import logging
+import math
 import os
 import shutil
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import entity_registry as er
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, discovery, entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.service import async_register_admin_service
 from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 from homeassistant.components.frontend import async_register_built_in_panel
 from homeassistant.components.lovelace.resources import ResourceStorageCollection
 
@@ -23,18 +39,115 @@ from .const import (
     CONF_ENERGY_ENTITY,
     CONF_TANK_CAPACITY,
     CONF_KWH_PER_LITRE,
+    CONF_WARNING_LEVEL,
+    CONF_CRITICAL_LEVEL,
+    CONF_HYSTERESIS,
     DEFAULT_KWH_PER_LITRE,
+    DEFAULT_WARNING_LEVEL,
+    DEFAULT_CRITICAL_LEVEL,
+    DEFAULT_HYSTERESIS,
+    DATA_AGGREGATE,
     PLATFORMS,
+    SERVICE_IMPORT_READINGS,
+    SERVICE_EXPORT_HISTORY,
+    SERVICE_SIMULATE_DELIVERY,
+    ATTR_ENTRY_ID,
+    ATTR_FILE,
+    ATTR_LEAD_TIME,
+    ATTR_MINIMUM_LEVEL,
+    ATTR_HORIZON,
+    ATTR_SIMULATIONS,
+    ATTR_RISK,
+    DEFAULT_HORIZON,
+    DEFAULT_SIMULATIONS,
+    DEFAULT_RISK,
+    EXPORT_CHUNK_SIZE,
+    SIGNAL_READING_COMMITTED,
 )
+from .aggregate import SiteAggregate
+from .threshold import ThresholdMonitor
 
 _LOGGER = logging.getLogger(__name__)
 
 CARD_JS_URL = "/local/heating-oil-tank-card.js"
 CARD_JS_FILE = "heating-oil-tank-card.js"
 
+READING_FIELDS = ("date", "litres", "energy")
+
+SERVICE_FILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTRY_ID): cv.string,
+        vol.Required(ATTR_FILE): cv.string,
+    }
+)
+
+SERVICE_SIMULATE_DELIVERY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTRY_ID): cv.string,
+        vol.Required(ATTR_LEAD_TIME): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=60)
+        ),
+        vol.Required(ATTR_MINIMUM_LEVEL): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(ATTR_HORIZON, default=DEFAULT_HORIZON): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=365)
+        ),
+        vol.Optional(ATTR_SIMULATIONS, default=DEFAULT_SIMULATIONS): vol.All(
+            vol.Coerce(int), vol.Range(min=100, max=20000)
+        ),
+        vol.Optional(ATTR_RISK, default=DEFAULT_RISK): vol.All(
+            vol.Coerce(float), vol.Range(min=0.001, max=0.5)
+        ),
+    }
+)
+
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Heating Oil Level component."""
+    hass.data.setdefault(DOMAIN, {})[DATA_AGGREGATE] = SiteAggregate(hass)
+
+    # Site-wide aggregate sensors are not tied to a single tank's config entry
+    hass.async_create_task(
+        discovery.async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config)
+    )
+
+    async def async_handle_import_readings(call: ServiceCall) -> None:
+        """Handle the import readings service call."""
+        await _async_import_readings(hass, call)
+
+    async def async_handle_export_history(call: ServiceCall) -> None:
+        """Handle the export history service call."""
+        await _async_export_history(hass, call)
+
+    async def async_handle_simulate_delivery(call: ServiceCall) -> ServiceResponse:
+        """Handle the simulate delivery service call."""
+        return await _async_simulate_delivery(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SIMULATE_DELIVERY,
+        async_handle_simulate_delivery,
+        schema=SERVICE_SIMULATE_DELIVERY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    # Both services touch files in the config directory, so admins only
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_IMPORT_READINGS,
+        async_handle_import_readings,
+        schema=SERVICE_FILE_SCHEMA,
+    )
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_EXPORT_HISTORY,
+        async_handle_export_history,
+        schema=SERVICE_FILE_SCHEMA,
+    )
+
     # Copy the card JS to the www folder
     await hass.async_add_executor_job(_copy_card_to_www, hass)
 
@@ -121,18 +234,48 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "energy_at_reading": None,
         }
 
+    # Added after the initial storage layout
+    stored_data.setdefault("daily_consumption", [])
+    stored_data.setdefault("day_start", None)
+    stored_data.setdefault("reading_version", 0)
+    stored_data.setdefault("threshold_state", {})
+
+    # The reading history has its own storage, so saving the live baseline
+    # doesn't rewrite years of readings each time
+    history_store = Store(
+        hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry.entry_id}_history"
+    )
+    history = await history_store.async_load()
+    if history is None:
+        history = {"readings": []}
+
     # Merge entry.data with entry.options (options take precedence)
     config_data = {**entry.data, **(entry.options or {})}
 
+    config = {
+        "energy_entity": config_data[CONF_ENERGY_ENTITY],
+        "tank_capacity": config_data.get(CONF_TANK_CAPACITY, 1000),
+        "kwh_per_litre": config_data.get(CONF_KWH_PER_LITRE, DEFAULT_KWH_PER_LITRE),
+        "warning_level": config_data.get(CONF_WARNING_LEVEL, DEFAULT_WARNING_LEVEL),
+        "critical_level": config_data.get(CONF_CRITICAL_LEVEL, DEFAULT_CRITICAL_LEVEL),
+        "hysteresis": config_data.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS),
+    }
+
     # Store configuration and data
     hass.data[DOMAIN][entry.entry_id] = {
         "store": store,
         "data": stored_data,
-        "config": {
-            "energy_entity": config_data[CONF_ENERGY_ENTITY],
-            "tank_capacity": config_data.get(CONF_TANK_CAPACITY, 1000),
-            "kwh_per_litre": config_data.get(CONF_KWH_PER_LITRE, DEFAULT_KWH_PER_LITRE),
-        },
+        "history_store": history_store,
+        "history": history,
+        "config": config,
+        "thresholds": ThresholdMonitor(
+            hass,
+            entry.entry_id,
+            config["warning_level"],
+            config["critical_level"],
+            config["hysteresis"],
+            stored_data["threshold_state"],
+        ),
     }
 
     # Set up platforms
@@ -159,9 +302,213 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+@callback
+def async_commit_reading(
+    hass: HomeAssistant, entry_id: str, reading: float, energy: float | None
+) -> int:
+    """Swap in a new reading baseline and refresh the tank's sensors.
+
+    The baseline is replaced in a single update with no await in between, so
+    an energy update can never see a half-written reading. Returns the new
+    reading version.
+    """
+    entry_data = hass.data[DOMAIN][entry_id]
+    data = entry_data["data"]
+    reading_date = datetime.now().isoformat()
+    version = data.get("reading_version", 0) + 1
+
+    data.update(
+        {
+            "last_reading": reading,
+            "last_reading_date": reading_date,
+            "energy_at_reading": energy,
+            "reading_version": version,
+        }
+    )
+    entry_data["history"]["readings"].append(
+        {"date": reading_date, "litres": reading, "energy": energy}
+    )
+
+    # One recompute and state write of every sensor for this commit
+    async_dispatcher_send(hass, SIGNAL_READING_COMMITTED.format(entry_id))
+
+    return version
+
+
 async def async_save_data(hass: HomeAssistant, entry_id: str) -> None:
     """Save data to storage."""
     if entry_id in hass.data[DOMAIN]:
         store = hass.data[DOMAIN][entry_id]["store"]
         data = hass.data[DOMAIN][entry_id]["data"]
         await store.async_save(data)
+
+
+async def async_save_history(hass: HomeAssistant, entry_id: str) -> None:
+    """Save the reading history to its own storage."""
+    if entry_id in hass.data[DOMAIN]:
+        history_store = hass.data[DOMAIN][entry_id]["history_store"]
+        history = hass.data[DOMAIN][entry_id]["history"]
+        await history_store.async_save(history)
+
+
+def _get_entry_data(hass: HomeAssistant, entry_id: str) -> dict[str, Any]:
+    """Return the runtime data of a loaded config entry for a service call."""
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN or entry_id not in hass.data[DOMAIN]:
+        raise HomeAssistantError(f"Heating oil tank {entry_id} is not loaded")
+    return hass.data[DOMAIN][entry_id]
+
+
+def _resolve_config_path(hass: HomeAssistant, file: str) -> Path:
+    """Resolve a service file path, which must be inside the config directory."""
+    path = Path(hass.config.path(file)).resolve()
+    if not path.is_relative_to(Path(hass.config.config_dir).resolve()):
+        raise HomeAssistantError(f"{file} is not inside the configuration directory")
+    return path
+
+
+def _resolve_export_path(hass: HomeAssistant, file: str) -> Path:
+    """Resolve an export path, which may only ever be a CSV file."""
+    path = _resolve_config_path(hass, file)
+    # Checked on the resolved path so a symlink can't point at another file
+    if path.suffix.lower() != ".csv":
+        raise HomeAssistantError(f"{file} must be a .csv file")
+    return path
+
+
+def _parse_reading(row: Any, tank_capacity: float) -> dict[str, Any]:
+    """Validate a single imported reading."""
+    if not isinstance(row, dict):
+        raise ValueError("reading must be an object")
+    if None in row:
+        # csv.DictReader puts values beyond the header under None
+        raise ValueError("row has more columns than the header")
+
+    reading_date = datetime.fromisoformat(str(row["date"]).strip())
+    if reading_date.tzinfo is not None:
+        # Stored dates are naive local time, like manual readings
+        reading_date = dt_util.as_local(reading_date).replace(tzinfo=None)
+
+    litres = float(row["litres"])
+    if not 0 <= litres <= tank_capacity:
+        raise ValueError(f"litres {litres} is outside 0-{tank_capacity}")
+
+    energy = row.get("energy")
+    if energy in (None, ""):
+        energy = None
+    else:
+        energy = float(energy)
+        if not math.isfinite(energy) or energy < 0:
+            raise ValueError(f"energy {energy} is not a valid meter reading")
+
+    return {"date": reading_date.isoformat(), "litres": litres, "energy": energy}
+
+
+def _load_readings(path: Path, tank_capacity: float) -> list[dict[str, Any]]:
+    """Stream-parse and validate readings from a CSV, JSON or JSON Lines file."""
+    readings = []
+    # Where the current reading came from, None while the error is file-wide
+    location: Callable[[], str | None] = lambda: None
+    try:
+        # utf-8-sig skips the byte order mark spreadsheet programs write
+        with path.open(encoding="utf-8-sig", newline="") as file:
+            suffix = path.suffix.lower()
+            if suffix == ".csv":
+                reader = csv.DictReader(file)
+                # The underlying reader's count is current even when a row fails
+                location = lambda: f"line {reader.reader.line_num}"
+                for row in reader:
+                    readings.append(_parse_reading(row, tank_capacity))
+            elif suffix in (".jsonl", ".ndjson"):
+                for line_num, line in enumerate(file, start=1):
+                    location = lambda: f"line {line_num}"
+                    if line.strip():
+                        readings.append(_parse_reading(json.loads(line), tank_capacity))
+            else:
+                rows = json.load(file)
+                if not isinstance(rows, list):
+                    raise ValueError("JSON file must contain a list of readings")
+                for index, row in enumerate(rows, start=1):
+                    location = lambda: f"reading {index}"
+                    readings.append(_parse_reading(row, tank_capacity))
+    except UnicodeDecodeError as err:
+        raise HomeAssistantError(f"{path.name} is not UTF-8 text: {err}") from err
+    except OSError as err:
+        raise HomeAssistantError(f"Could not read {path}: {err}") from err
+    except (csv.Error, KeyError, TypeError, ValueError) as err:
+        if (where := location()) is None:
+            raise HomeAssistantError(f"Invalid readings file {path.name}: {err}") from err
+        raise HomeAssistantError(
+            f"Invalid reading in {path.name} at {where}: {err}"
+        ) from err
+    return readings
+
+
+async def _async_import_readings(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Import historical readings from a file in the config directory."""
+    entry_id = call.data[ATTR_ENTRY_ID]
+    entry_data = _get_entry_data(hass, entry_id)
+    path = _resolve_config_path(hass, call.data[ATTR_FILE])
+
+    imported = await hass.async_add_executor_job(
+        _load_readings, path, entry_data["config"]["tank_capacity"]
+    )
+
+    # Imported readings replace any existing reading with the same date
+    history = entry_data["history"]
+    readings = {reading["date"]: reading for reading in history["readings"]}
+    readings.update((reading["date"], reading) for reading in imported)
+    history["readings"] = sorted(
+        readings.values(), key=lambda reading: reading["date"]
+    )
+
+    await async_save_history(hass, entry_id)
+
+    _LOGGER.info("Imported %s oil readings from %s", len(imported), path)
+
+
+def _write_history(path: Path, readings: list[dict[str, Any]]) -> None:
+    """Write readings to a CSV file chunk by chunk."""
+    if path.exists() and not path.is_file():
+        raise HomeAssistantError(f"{path} is not a file")
+
+    temp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with temp_path.open("w", encoding="utf-8", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=READING_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            for start in range(0, len(readings), EXPORT_CHUNK_SIZE):
+                writer.writerows(readings[start : start + EXPORT_CHUNK_SIZE])
+        os.replace(temp_path, path)
+    except OSError as err:
+        temp_path.unlink(missing_ok=True)
+        raise HomeAssistantError(f"Could not write {path}: {err}") from err
+
+
+async def _async_export_history(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Export the reading history to a CSV file in the config directory."""
+    entry_data = _get_entry_data(hass, call.data[ATTR_ENTRY_ID])
+    path = _resolve_export_path(hass, call.data[ATTR_FILE])
+
+    # Shallow copy so readings added during the export don't affect it
+    readings = list(entry_data["history"]["readings"])
+    await hass.async_add_executor_job(_write_history, path, readings)
+
+    _LOGGER.info("Exported %s oil readings to %s", len(readings), path)
+
+
+async def _async_simulate_delivery(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Run the delivery planning simulation for a tank."""
+    entry_data = _get_entry_data(hass, call.data[ATTR_ENTRY_ID])
+    if (level_sensor := entry_data.get("level_sensor")) is None:
+        raise HomeAssistantError("The tank's sensors are not set up yet")
+
+    return await level_sensor.async_simulate_delivery(
+        call.data[ATTR_LEAD_TIME],
+        call.data[ATTR_MINIMUM_LEVEL],
+        call.data[ATTR_HORIZON],
+        call.data[ATTR_SIMULATIONS],
+        call.data[ATTR_RISK],
+    )
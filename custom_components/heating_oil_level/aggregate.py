@@ -0,0 +1,142 @@
+"""Site-level aggregation across tanks for Heating Oil Level integration."""
+from __future__ import annotations
+
+import heapq
+import logging
+from datetime import datetime
+from itertools import count
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import SIGNAL_AGGREGATE_UPDATED
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SiteAggregate:
+    """Maintain totals across all tanks by applying per-tank deltas.
+
+    Each tank reports its latest figures through async_update_tank. Sums are
+    adjusted by the difference from the tank's previous report, and the
+    earliest run-out is kept in a heap with lazily discarded stale entries,
+    so an update never re-sums the other tanks.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the site aggregate."""
+        self.hass = hass
+        self.total_remaining = 0.0
+        self.total_capacity = 0.0
+        self.total_burn_rate = 0.0
+        # Tanks reporting a burn rate, which a new reading doesn't have yet
+        self._burn_rate_tanks: set[str] = set()
+        self._tanks: dict[str, tuple[float, float, float]] = {}
+        self._run_outs: dict[str, tuple[datetime, int]] = {}
+        self._run_out_heap: list[tuple[datetime, int, str]] = []
+        self._sequence = count()
+
+    @property
+    def tank_count(self) -> int:
+        """Return the number of tanks contributing to the aggregate."""
+        return len(self._tanks)
+
+    @property
+    def burn_rate(self) -> float | None:
+        """Return the combined burn rate, None until any tank has one."""
+        if not self._burn_rate_tanks:
+            return None
+        return max(0, self.total_burn_rate)
+
+    @property
+    def percentage(self) -> float | None:
+        """Return the capacity weighted percentage across all tanks."""
+        if self.total_capacity <= 0:
+            return None
+        percentage = (self.total_remaining / self.total_capacity) * 100
+        return round(min(100, max(0, percentage)), 1)
+
+    @property
+    def earliest_run_out(self) -> datetime | None:
+        """Return the earliest predicted run-out across all tanks."""
+        heap = self._run_out_heap
+        while heap:
+            run_out, sequence, entry_id = heap[0]
+            if self._run_outs.get(entry_id) == (run_out, sequence):
+                return run_out
+            heapq.heappop(heap)
+        return None
+
+    @callback
+    def async_update_tank(
+        self,
+        entry_id: str,
+        remaining: float | None,
+        capacity: float,
+        burn_rate: float | None,
+        run_out: datetime | None,
+    ) -> None:
+        """Apply the latest figures for a tank."""
+        new = (remaining or 0.0, float(capacity), burn_rate or 0.0)
+        old = self._tanks.get(entry_id, (0.0, 0.0, 0.0))
+        previous_run_out = self._run_outs.get(entry_id, (None, None))[0]
+
+        has_burn_rate = burn_rate is not None
+
+        if (
+            entry_id in self._tanks
+            and new == old
+            and previous_run_out == run_out
+            and has_burn_rate == (entry_id in self._burn_rate_tanks)
+        ):
+            return
+
+        self._tanks[entry_id] = new
+        self.total_remaining += new[0] - old[0]
+        self.total_capacity += new[1] - old[1]
+        self.total_burn_rate += new[2] - old[2]
+        if has_burn_rate:
+            self._burn_rate_tanks.add(entry_id)
+        else:
+            self._burn_rate_tanks.discard(entry_id)
+
+        if run_out is None:
+            self._run_outs.pop(entry_id, None)
+        else:
+            sequence = next(self._sequence)
+            self._run_outs[entry_id] = (run_out, sequence)
+            heapq.heappush(self._run_out_heap, (run_out, sequence, entry_id))
+            self._compact_run_outs()
+
+        async_dispatcher_send(self.hass, SIGNAL_AGGREGATE_UPDATED)
+
+    @callback
+    def async_remove_tank(self, entry_id: str) -> None:
+        """Remove a tank from the aggregate."""
+        if (old := self._tanks.pop(entry_id, None)) is None:
+            return
+
+        self.total_remaining -= old[0]
+        self.total_capacity -= old[1]
+        self.total_burn_rate -= old[2]
+        self._run_outs.pop(entry_id, None)
+        self._burn_rate_tanks.discard(entry_id)
+
+        if not self._tanks:
+            # Reset to exact zeros so float error cannot accumulate
+            self.total_remaining = 0.0
+            self.total_capacity = 0.0
+            self.total_burn_rate = 0.0
+            self._run_out_heap.clear()
+
+        async_dispatcher_send(self.hass, SIGNAL_AGGREGATE_UPDATED)
+
+    def _compact_run_outs(self) -> None:
+        """Drop stale heap entries once they outnumber the live ones."""
+        if len(self._run_out_heap) <= 2 * len(self._run_outs) + 16:
+            return
+        self._run_out_heap = [
+            (run_out, sequence, entry_id)
+            for entry_id, (run_out, sequence) in self._run_outs.items()
+        ]
+        heapq.heapify(self._run_out_heap)
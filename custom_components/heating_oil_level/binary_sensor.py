@@ -0,0 +1,107 @@
+"""Binary sensor platform for Heating Oil Level integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import (
+    DOMAIN,
+    ATTR_HYSTERESIS,
+    ATTR_THRESHOLD_LEVEL,
+    SIGNAL_THRESHOLD_UPDATED,
+    THRESHOLD_CRITICAL,
+    THRESHOLD_WARNING,
+)
+from .threshold import ThresholdMonitor
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Heating Oil Level binary sensors."""
+    thresholds = hass.data[DOMAIN][entry.entry_id]["thresholds"]
+
+    entities = [
+        OilThresholdBinarySensor(
+            entry, thresholds, THRESHOLD_WARNING, "Oil Level Warning", "mdi:oil-level"
+        ),
+        OilThresholdBinarySensor(
+            entry, thresholds, THRESHOLD_CRITICAL, "Oil Level Critical", "mdi:oil-lamp"
+        ),
+    ]
+
+    async_add_entities(entities)
+
+
+class OilThresholdBinarySensor(BinarySensorEntity):
+    """Binary sensor that is on while the oil level is below a threshold."""
+
+    _attr_has_entity_name = True
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        thresholds: ThresholdMonitor,
+        threshold: str,
+        name: str,
+        icon: str,
+    ) -> None:
+        """Initialize the binary sensor."""
+        self._entry = entry
+        self._thresholds = thresholds
+        self._threshold = threshold
+        self._attr_name = name
+        self._attr_icon = icon
+        self._attr_unique_id = f"{entry.entry_id}_{threshold}_threshold"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name="Heating Oil Tank",
+            manufacturer="Custom",
+            model="Oil Level Monitor",
+        )
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return true if the oil level is below the threshold."""
+        return self._thresholds.active[self._threshold]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes."""
+        return {
+            ATTR_THRESHOLD_LEVEL: self._thresholds.levels[self._threshold],
+            ATTR_HYSTERESIS: self._thresholds.hysteresis,
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        await super().async_added_to_hass()
+
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_THRESHOLD_UPDATED.format(self._entry.entry_id),
+                self._async_threshold_updated,
+            )
+        )
+
+    @callback
+    def _async_threshold_updated(self) -> None:
+        """Handle threshold state changes."""
+        self.async_write_ha_state()
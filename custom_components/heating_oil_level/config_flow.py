@@ -18,8 +18,14 @@ from .const import (
     CONF_ENERGY_ENTITY,
     CONF_TANK_CAPACITY,
     CONF_KWH_PER_LITRE,
+    CONF_WARNING_LEVEL,
+    CONF_CRITICAL_LEVEL,
+    CONF_HYSTERESIS,
     DEFAULT_TANK_CAPACITY,
     DEFAULT_KWH_PER_LITRE,
+    DEFAULT_WARNING_LEVEL,
+    DEFAULT_CRITICAL_LEVEL,
+    DEFAULT_HYSTERESIS,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -113,9 +119,14 @@ class HeatingOilLevelOptionsFlow(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            # Return options data (don't modify entry.data)
-            return self.async_create_entry(title="", data=user_input)
+            if user_input[CONF_CRITICAL_LEVEL] > user_input[CONF_WARNING_LEVEL]:
+                errors["base"] = "critical_above_warning"
+            else:
+                # Return options data (don't modify entry.data)
+                return self.async_create_entry(title="", data=user_input)
 
         # Merge data and options (options take precedence)
         current_config = {**self.config_entry.data, **(self.config_entry.options or {})}
@@ -150,7 +161,53 @@ class HeatingOilLevelOptionsFlow(config_entries.OptionsFlow):
                         mode=selector.NumberSelectorMode.BOX,
                     )
                 ),
+                vol.Required(
+                    CONF_WARNING_LEVEL,
+                    default=current_config.get(
+                        CONF_WARNING_LEVEL, DEFAULT_WARNING_LEVEL
+                    ),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=100,
+                        step=1,
+                        unit_of_measurement="%",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Required(
+                    CONF_CRITICAL_LEVEL,
+                    default=current_config.get(
+                        CONF_CRITICAL_LEVEL, DEFAULT_CRITICAL_LEVEL
+                    ),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=100,
+                        step=1,
+                        unit_of_measurement="%",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Required(
+                    CONF_HYSTERESIS,
+                    default=current_config.get(
+                        CONF_HYSTERESIS, DEFAULT_HYSTERESIS
+                    ),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=20,
+                        step=0.5,
+                        unit_of_measurement="%",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
             }
         )
 
-        return self.async_show_form(step_id="init", data_schema=data_schema)
+        return self.async_show_form(
+            step_id="init",
+            data_schema=data_schema,
+            errors=errors,
+        )
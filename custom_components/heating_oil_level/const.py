@@ -6,10 +6,16 @@ DOMAIN = "heating_oil_level"
 CONF_ENERGY_ENTITY = "energy_entity"
 CONF_TANK_CAPACITY = "tank_capacity"
 CONF_KWH_PER_LITRE = "kwh_per_litre"
+CONF_WARNING_LEVEL = "warning_level"
+CONF_CRITICAL_LEVEL = "critical_level"
+CONF_HYSTERESIS = "hysteresis"
 
 # Default values
 DEFAULT_TANK_CAPACITY = 1000  # litres
 DEFAULT_KWH_PER_LITRE = 10.35  # kWh per litre of heating oil
+DEFAULT_WARNING_LEVEL = 25  # percent
+DEFAULT_CRITICAL_LEVEL = 10  # percent
+DEFAULT_HYSTERESIS = 2  # percentage points
 
 # Storage keys
 STORAGE_KEY = f"{DOMAIN}.storage"
@@ -21,6 +27,53 @@ ATTR_LAST_READING_DATE = "last_reading_date"
 ATTR_ENERGY_AT_READING = "energy_at_reading"
 ATTR_OIL_CONSUMED = "oil_consumed"
 ATTR_TANK_CAPACITY = "tank_capacity"
+ATTR_THRESHOLD = "threshold"
+ATTR_THRESHOLD_LEVEL = "threshold_level"
+ATTR_HYSTERESIS = "hysteresis"
+ATTR_BURN_RATE = "burn_rate"
+ATTR_TANK_COUNT = "tank_count"
+
+# Services
+SERVICE_IMPORT_READINGS = "import_readings"
+SERVICE_EXPORT_HISTORY = "export_history"
+SERVICE_SIMULATE_DELIVERY = "simulate_delivery"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_FILE = "file"
+ATTR_LEAD_TIME = "lead_time"
+ATTR_MINIMUM_LEVEL = "minimum_level"
+ATTR_HORIZON = "horizon"
+ATTR_SIMULATIONS = "simulations"
+ATTR_RISK = "risk"
+
+# Readings written per chunk when exporting history
+EXPORT_CHUNK_SIZE = 500
+
+# Delivery planning simulation
+DEFAULT_HORIZON = 90  # days
+DEFAULT_SIMULATIONS = 5000
+DEFAULT_RISK = 0.05
+MIN_FORECAST_DAYS = 7  # days of consumption history needed to simulate
+MAX_DAILY_CONSUMPTION_DAYS = 365  # days of consumption history kept
+
+# Burn rate
+BURN_RATE_DAYS = 14  # recent days of consumption averaged for the burn rate
+MIN_BURN_RATE_HISTORY_DAYS = 7  # recorded days before the burn rate uses them
+MIN_BURN_RATE_DAYS = 1  # days since a reading before it gives a burn rate
+
+# Thresholds
+THRESHOLD_WARNING = "warning"
+THRESHOLD_CRITICAL = "critical"
+
+# Events
+EVENT_THRESHOLD_CROSSED = f"{DOMAIN}_threshold_crossed"
+
+# Dispatcher signals (formatted with the config entry ID)
+SIGNAL_THRESHOLD_UPDATED = f"{DOMAIN}_threshold_updated_{{}}"
+SIGNAL_AGGREGATE_UPDATED = f"{DOMAIN}_aggregate_updated"
+SIGNAL_READING_COMMITTED = f"{DOMAIN}_reading_committed_{{}}"
+
+# hass.data[DOMAIN] key for the site aggregate shared by all tanks
+DATA_AGGREGATE = "site_aggregate"
 
 # Platforms
-PLATFORMS = ["sensor", "number"]
+PLATFORMS = ["sensor", "binary_sensor", "number"]
@@ -0,0 +1,64 @@
+"""Delivery planning simulation for Heating Oil Level integration."""
+from __future__ import annotations
+
+from typing import Any
+
+# Paths simulated per NumPy batch, keeps peak memory to a few megabytes
+SIMULATION_CHUNK_SIZE = 1000
+
+
+def simulate_delivery(
+    current_level: float,
+    daily_consumption: list[float],
+    lead_time: int,
+    minimum_level: float,
+    horizon: int,
+    simulations: int,
+    risk: float,
+) -> dict[str, Any]:
+    """Simulate consumption paths and find the latest safe order day.
+
+    Every path draws its daily consumption from the tank's own daily history.
+    Paths are generated in vectorized chunks and only the day each one first
+    drops below the minimum is kept. Blocking, run it in the executor.
+    """
+    # Imported here so the event loop never pays for loading NumPy
+    import numpy as np
+
+    rng = np.random.default_rng()
+    samples = np.asarray(daily_consumption, dtype=np.float32)
+    available = current_level - minimum_level
+
+    # Number of paths first dropping below the minimum on each day
+    first_below = np.zeros(horizon, dtype=np.int64)
+    for start in range(0, simulations, SIMULATION_CHUNK_SIZE):
+        size = min(SIMULATION_CHUNK_SIZE, simulations - start)
+        used = rng.choice(samples, size=(size, horizon))
+        np.cumsum(used, axis=1, out=used)
+        below = used > available
+        crossed = below.any(axis=1)
+        first_below += np.bincount(
+            below[crossed].argmax(axis=1), minlength=horizon
+        )
+
+    # Each day's probability is the chance of having run low by then
+    probabilities = np.cumsum(first_below) / simulations
+
+    # An order placed on day N must cover consumption up to day N + lead_time - 1
+    too_risky = probabilities > risk
+    at_risk_day = int(np.argmax(too_risky)) if too_risky.any() else None
+    order_day = None
+    too_late = False
+    if at_risk_day is not None:
+        order_day = at_risk_day - lead_time
+        if order_day < 0:
+            # Even ordering today would arrive after the tank runs low
+            order_day = None
+            too_late = True
+
+    return {
+        "probabilities": [round(float(p), 4) for p in probabilities],
+        "order_day": order_day,
+        "at_risk_day": at_risk_day,
+        "too_late": too_late,
+    }
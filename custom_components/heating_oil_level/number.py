@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
 from typing import Any
 
 from homeassistant.components.number import NumberEntity, NumberMode
@@ -18,7 +17,7 @@ from .const import (
     CONF_TANK_CAPACITY,
     DEFAULT_KWH_PER_LITRE,
 )
-from . import async_save_data
+from . import async_commit_reading, async_save_data, async_save_history
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -96,24 +95,23 @@ class OilReadingInput(NumberEntity, RestoreEntity):
             except (ValueError, TypeError):
                 pass
 
-        # Update the stored data
-        self._data["last_reading"] = value
-        self._data["last_reading_date"] = datetime.now().isoformat()
-        self._data["energy_at_reading"] = current_energy
+        # Commit the new baseline and refresh the sensors in one step
+        version = async_commit_reading(
+            self.hass, self._entry.entry_id, value, current_energy
+        )
         self._value = value
-
-        # Save to persistent storage
-        await async_save_data(self.hass, self._entry.entry_id)
-
-        # Update all entities
         self.async_write_ha_state()
 
-        # Trigger sensor updates by firing an event
+        # Let automations know about the new reading
         self.hass.bus.async_fire(
             f"{DOMAIN}_reading_updated",
-            {"entry_id": self._entry.entry_id, "reading": value},
+            {"entry_id": self._entry.entry_id, "reading": value, "version": version},
         )
 
+        # Save to persistent storage
+        await async_save_data(self.hass, self._entry.entry_id)
+        await async_save_history(self.hass, self._entry.entry_id)
+
         _LOGGER.info(
             "Oil reading updated: %s L, energy baseline: %s kWh",
             value,
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -12,11 +12,15 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfVolume, UnitOfEnergy
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, ServiceResponse, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
@@ -29,8 +33,27 @@ from .const import (
     ATTR_ENERGY_AT_READING,
     ATTR_OIL_CONSUMED,
     ATTR_TANK_CAPACITY,
+    ATTR_BURN_RATE,
+    ATTR_TANK_COUNT,
+    ATTR_LEAD_TIME,
+    ATTR_MINIMUM_LEVEL,
+    ATTR_SIMULATIONS,
+    ATTR_RISK,
+    BURN_RATE_DAYS,
+    MIN_BURN_RATE_DAYS,
+    MIN_BURN_RATE_HISTORY_DAYS,
+    DATA_AGGREGATE,
+    DEFAULT_HORIZON,
+    DEFAULT_SIMULATIONS,
+    DEFAULT_RISK,
+    MIN_FORECAST_DAYS,
+    MAX_DAILY_CONSUMPTION_DAYS,
+    SIGNAL_AGGREGATE_UPDATED,
+    SIGNAL_READING_COMMITTED,
 )
 from . import async_save_data
+from .aggregate import SiteAggregate
+from .forecast import simulate_delivery
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,6 +76,32 @@ async def async_setup_entry(
 
     async_add_entities(entities)
 
+    # The delivery simulation service runs against this tank's level sensor
+    hass.data[DOMAIN][entry.entry_id]["level_sensor"] = entities[0]
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the site aggregate sensors."""
+    if discovery_info is None:
+        return
+
+    aggregate = hass.data[DOMAIN][DATA_AGGREGATE]
+
+    entities = [
+        SiteTotalRemainingSensor(aggregate),
+        SiteTotalCapacitySensor(aggregate),
+        SitePercentageSensor(aggregate),
+        SiteBurnRateSensor(aggregate),
+        SiteRunOutSensor(aggregate),
+    ]
+
+    async_add_entities(entities)
+
 
 class OilLevelBaseSensor(SensorEntity, RestoreEntity):
     """Base class for oil level sensors."""
@@ -120,6 +169,44 @@ class OilLevelBaseSensor(SensorEntity, RestoreEntity):
         current_level = self._data["last_reading"] - oil_consumed
         return max(0, round(current_level, 2))
 
+    def _calculate_percentage(self) -> float | None:
+        """Calculate current oil level as a percentage of tank capacity."""
+        current_level = self._calculate_current_level()
+        if current_level is None:
+            return None
+        percentage = (current_level / self._tank_capacity) * 100
+        return round(min(100, max(0, percentage)), 1)
+
+    def _calculate_burn_rate(self) -> float | None:
+        """Calculate a smoothed oil burn rate in litres per day.
+
+        Uses the average of the most recent recorded days, falling back to the
+        average since the last reading once at least a day has passed.
+        """
+        daily_consumption = self._data.get("daily_consumption") or []
+        if len(daily_consumption) >= MIN_BURN_RATE_HISTORY_DAYS:
+            recent = daily_consumption[-BURN_RATE_DAYS:]
+            return round(sum(day["litres"] for day in recent) / len(recent), 2)
+
+        if self._data.get("last_reading_date") is None:
+            return None
+
+        oil_consumed = self._calculate_oil_consumed()
+        if oil_consumed is None:
+            return None
+
+        try:
+            last_reading_date = datetime.fromisoformat(self._data["last_reading_date"])
+        except (ValueError, TypeError):
+            return None
+
+        # Too noisy in the first hours after a reading
+        days = (datetime.now() - last_reading_date).total_seconds() / 86400
+        if days < MIN_BURN_RATE_DAYS:
+            return None
+
+        return round(oil_consumed / days, 2)
+
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
@@ -133,9 +220,23 @@ class OilLevelBaseSensor(SensorEntity, RestoreEntity):
             )
         )
 
+        # Refresh as soon as a new reading is committed
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_READING_COMMITTED.format(self._entry.entry_id),
+                self._async_refresh,
+            )
+        )
+
     @callback
     def _async_energy_state_changed(self, event) -> None:
         """Handle energy entity state changes."""
+        self._async_refresh()
+
+    @callback
+    def _async_refresh(self) -> None:
+        """Recalculate and write the sensor state."""
         self.async_write_ha_state()
 
 
@@ -158,6 +259,194 @@ class OilLevelSensor(OilLevelBaseSensor):
         """Initialize the sensor."""
         super().__init__(hass, entry, config, data)
         self._attr_unique_id = f"{entry.entry_id}_oil_level"
+        self._thresholds = hass.data[DOMAIN][entry.entry_id]["thresholds"]
+        self._aggregate: SiteAggregate = hass.data[DOMAIN][DATA_AGGREGATE]
+        # Simulation results, valid until the next reading or day rollover
+        # Holds (current level, history days, simulation result) per parameter
+        # set; responses are built fresh from it so callers can't alter it
+        self._forecast_cache: dict[tuple, tuple[float, int, dict[str, Any]]] = {}
+        self._forecast_cache_key: tuple | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        await super().async_added_to_hass()
+
+        # Establish the initial threshold state, or continue from the saved one,
+        # without firing a crossing
+        self._async_publish_level()
+
+        self.async_on_remove(
+            lambda: self._aggregate.async_remove_tank(self._entry.entry_id)
+        )
+
+    @callback
+    def _async_refresh(self) -> None:
+        """Recalculate and write the sensor state."""
+        super()._async_refresh()
+        self._async_publish_level()
+
+    @callback
+    def _async_publish_level(self) -> None:
+        """Feed the recalculated level to the thresholds and site aggregate.
+
+        This runs once per tank update, on the level sensor only.
+        """
+        self._async_track_daily_consumption()
+        if self._thresholds.async_evaluate(self._calculate_percentage()):
+            self.hass.async_create_task(
+                async_save_data(self.hass, self._entry.entry_id)
+            )
+
+        current_level = self._calculate_current_level()
+        if current_level is None:
+            # Without a reading the tank would only dilute the site totals
+            self._aggregate.async_remove_tank(self._entry.entry_id)
+            return
+
+        burn_rate = self._calculate_burn_rate()
+        run_out = None
+        if burn_rate:
+            # Whole hours, so the run-out only changes when it really moves
+            run_out = (
+                dt_util.now() + timedelta(days=current_level / burn_rate)
+            ).replace(minute=0, second=0, microsecond=0)
+
+        self._aggregate.async_update_tank(
+            self._entry.entry_id,
+            current_level,
+            self._tank_capacity,
+            burn_rate,
+            run_out,
+        )
+
+    @callback
+    def _async_track_daily_consumption(self) -> None:
+        """Record the oil burned on each completed day."""
+        current_energy = self._get_current_energy()
+        if current_energy is None:
+            return
+
+        today = dt_util.now().date()
+        day_start = self._data.get("day_start")
+        if day_start is None:
+            # Started part way through the day, so don't record it
+            self._data["day_start"] = {
+                "date": today.isoformat(),
+                "energy": current_energy,
+                "partial": True,
+            }
+            return
+
+        start_date = date.fromisoformat(day_start["date"])
+        days = (today - start_date).days
+        if days <= 0:
+            return
+
+        if not day_start.get("partial"):
+            energy_used = max(0, current_energy - day_start["energy"])
+            # Spread over any days without an energy update
+            litres = round(energy_used / self._kwh_per_litre / days, 2)
+            daily_consumption = self._data["daily_consumption"]
+            for offset in range(max(0, days - MAX_DAILY_CONSUMPTION_DAYS), days):
+                daily_consumption.append(
+                    {
+                        "date": (start_date + timedelta(days=offset)).isoformat(),
+                        "litres": litres,
+                    }
+                )
+            del daily_consumption[:-MAX_DAILY_CONSUMPTION_DAYS]
+
+        self._data["day_start"] = {
+            "date": today.isoformat(),
+            "energy": current_energy,
+        }
+        self.hass.async_create_task(async_save_data(self.hass, self._entry.entry_id))
+
+    async def async_simulate_delivery(
+        self,
+        lead_time: int,
+        minimum_level: float,
+        horizon: int = DEFAULT_HORIZON,
+        simulations: int = DEFAULT_SIMULATIONS,
+        risk: float = DEFAULT_RISK,
+    ) -> ServiceResponse:
+        """Simulate consumption to find when to order a delivery."""
+        today = dt_util.now().date()
+        cache_key = (self._data.get("reading_version"), today)
+        if cache_key != self._forecast_cache_key:
+            self._forecast_cache = {}
+            self._forecast_cache_key = cache_key
+
+        params = (lead_time, minimum_level, horizon, simulations, risk)
+        if (cached := self._forecast_cache.get(params)) is None:
+            cached = await self._async_run_simulation(*params)
+            self._forecast_cache[params] = cached
+
+        current_level, history_days, result = cached
+        order_day = result["order_day"]
+        at_risk_day = result["at_risk_day"]
+        return {
+            "current_level": current_level,
+            ATTR_MINIMUM_LEVEL: minimum_level,
+            ATTR_LEAD_TIME: lead_time,
+            ATTR_SIMULATIONS: simulations,
+            ATTR_RISK: risk,
+            "history_days": history_days,
+            "recommended_order_date": (
+                None
+                if order_day is None
+                else (today + timedelta(days=order_day)).isoformat()
+            ),
+            # Set when even an order placed today would arrive too late
+            "order_too_late": result["too_late"],
+            "earliest_at_risk_date": (
+                None
+                if at_risk_day is None
+                else (today + timedelta(days=at_risk_day)).isoformat()
+            ),
+            "run_low_probability": [
+                {
+                    "date": (today + timedelta(days=day)).isoformat(),
+                    "probability": probability,
+                }
+                for day, probability in enumerate(result["probabilities"])
+            ],
+        }
+
+    async def _async_run_simulation(
+        self,
+        lead_time: int,
+        minimum_level: float,
+        horizon: int,
+        simulations: int,
+        risk: float,
+    ) -> tuple[float, int, dict[str, Any]]:
+        """Run the simulation in the executor from the current level."""
+        current_level = self._calculate_current_level()
+        if current_level is None:
+            raise HomeAssistantError("No oil reading has been entered yet")
+
+        daily_consumption = [
+            day["litres"] for day in self._data.get("daily_consumption", [])
+        ]
+        if len(daily_consumption) < MIN_FORECAST_DAYS:
+            raise HomeAssistantError(
+                f"At least {MIN_FORECAST_DAYS} days of consumption history are "
+                f"needed, only {len(daily_consumption)} recorded"
+            )
+
+        result = await self.hass.async_add_executor_job(
+            simulate_delivery,
+            current_level,
+            daily_consumption,
+            lead_time,
+            minimum_level,
+            horizon,
+            simulations,
+            risk,
+        )
+
+        return current_level, len(daily_consumption), result
 
     @property
     def native_value(self) -> float | None:
@@ -173,6 +462,7 @@ class OilLevelSensor(OilLevelBaseSensor):
             ATTR_ENERGY_AT_READING: self._data.get("energy_at_reading"),
             ATTR_OIL_CONSUMED: self._calculate_oil_consumed(),
             ATTR_TANK_CAPACITY: self._tank_capacity,
+            ATTR_BURN_RATE: self._calculate_burn_rate(),
         }
 
 
@@ -198,11 +488,7 @@ class OilPercentageSensor(OilLevelBaseSensor):
     @property
     def native_value(self) -> float | None:
         """Return the current oil level as percentage."""
-        current_level = self._calculate_current_level()
-        if current_level is None:
-            return None
-        percentage = (current_level / self._tank_capacity) * 100
-        return round(min(100, max(0, percentage)), 1)
+        return self._calculate_percentage()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -266,3 +552,124 @@ class OilRemainingLitresSensor(OilLevelBaseSensor):
     def native_value(self) -> float | None:
         """Return remaining oil level."""
         return self._calculate_current_level()
+
+
+class SiteAggregateBaseSensor(SensorEntity):
+    """Base class for sensors aggregated across all tanks."""
+
+    _attr_should_poll = False
+
+    def __init__(self, aggregate: SiteAggregate) -> None:
+        """Initialize the sensor."""
+        self._aggregate = aggregate
+        self._last_written: tuple | None = None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes."""
+        return {
+            ATTR_TANK_COUNT: self._aggregate.tank_count,
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        await super().async_added_to_hass()
+
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_AGGREGATE_UPDATED,
+                self._async_aggregate_updated,
+            )
+        )
+
+    @callback
+    def _async_aggregate_updated(self) -> None:
+        """Handle aggregate updates."""
+        # Only write when this sensor's own value has changed
+        written = (self.native_value, self._aggregate.tank_count)
+        if written == self._last_written:
+            return
+        self._last_written = written
+        self.async_write_ha_state()
+
+
+class SiteTotalRemainingSensor(SiteAggregateBaseSensor):
+    """Sensor for total oil remaining across all tanks."""
+
+    _attr_native_unit_of_measurement = UnitOfVolume.LITERS
+    _attr_device_class = SensorDeviceClass.VOLUME_STORAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:oil"
+    _attr_name = "Heating Oil Site Remaining"
+    _attr_unique_id = f"{DOMAIN}_site_total_remaining"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the total oil remaining."""
+        if not self._aggregate.tank_count:
+            return None
+        return round(max(0, self._aggregate.total_remaining), 2)
+
+
+class SiteTotalCapacitySensor(SiteAggregateBaseSensor):
+    """Sensor for total capacity across all tanks."""
+
+    _attr_native_unit_of_measurement = UnitOfVolume.LITERS
+    _attr_device_class = SensorDeviceClass.VOLUME_STORAGE
+    _attr_icon = "mdi:storage-tank"
+    _attr_name = "Heating Oil Site Capacity"
+    _attr_unique_id = f"{DOMAIN}_site_total_capacity"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the total tank capacity."""
+        if not self._aggregate.tank_count:
+            return None
+        return round(self._aggregate.total_capacity, 2)
+
+
+class SitePercentageSensor(SiteAggregateBaseSensor):
+    """Sensor for capacity weighted oil level across all tanks."""
+
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:gauge"
+    _attr_name = "Heating Oil Site Percentage"
+    _attr_unique_id = f"{DOMAIN}_site_percentage"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the weighted oil level percentage."""
+        return self._aggregate.percentage
+
+
+class SiteBurnRateSensor(SiteAggregateBaseSensor):
+    """Sensor for combined burn rate across all tanks."""
+
+    _attr_native_unit_of_measurement = f"{UnitOfVolume.LITERS}/d"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:fire"
+    _attr_name = "Heating Oil Site Burn Rate"
+    _attr_unique_id = f"{DOMAIN}_site_burn_rate"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the combined burn rate in litres per day."""
+        if (burn_rate := self._aggregate.burn_rate) is None:
+            return None
+        return round(burn_rate, 2)
+
+
+class SiteRunOutSensor(SiteAggregateBaseSensor):
+    """Sensor for the earliest predicted run-out across all tanks."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:calendar-alert"
+    _attr_name = "Heating Oil Site Run Out"
+    _attr_unique_id = f"{DOMAIN}_site_earliest_run_out"
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return the earliest predicted run-out."""
+        return self._aggregate.earliest_run_out
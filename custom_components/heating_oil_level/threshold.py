@@ -0,0 +1,107 @@
+"""Low level threshold alerts for Heating Oil Level integration."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import (
+    ATTR_HYSTERESIS,
+    ATTR_THRESHOLD,
+    ATTR_THRESHOLD_LEVEL,
+    EVENT_THRESHOLD_CROSSED,
+    SIGNAL_THRESHOLD_UPDATED,
+    THRESHOLD_CRITICAL,
+    THRESHOLD_WARNING,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ThresholdMonitor:
+    """Track warning/critical low level alerts with hysteresis.
+
+    An alert becomes active once the percentage drops to or below its level
+    and only clears again once the percentage rises to the level plus the
+    hysteresis band, so readings hovering around a boundary do not flap.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        warning_level: float,
+        critical_level: float,
+        hysteresis: float,
+        active: dict[str, bool | None],
+    ) -> None:
+        """Initialize the threshold monitor.
+
+        active is the persisted alert state, updated in place so it survives
+        restarts and reloads without re-firing a crossing.
+        """
+        self.hass = hass
+        self._entry_id = entry_id
+        self.hysteresis = hysteresis
+        self.levels: dict[str, float] = {
+            THRESHOLD_WARNING: warning_level,
+            THRESHOLD_CRITICAL: critical_level,
+        }
+        # None until the first percentage has been evaluated
+        self.active = active
+        for threshold in self.levels:
+            self.active.setdefault(threshold, None)
+
+    @callback
+    def async_evaluate(self, percentage: float | None) -> bool:
+        """Evaluate the current percentage against the thresholds.
+
+        Returns True if any alert state changed and should be saved.
+        """
+        if percentage is None:
+            return False
+
+        changed = False
+        for threshold, level in self.levels.items():
+            was_active = self.active[threshold]
+            if was_active:
+                is_active = percentage < level + self.hysteresis
+            else:
+                is_active = percentage <= level
+
+            if is_active == was_active:
+                continue
+
+            self.active[threshold] = is_active
+            changed = True
+
+            # The first evaluation only establishes the state, it is not a crossing
+            if was_active is None:
+                continue
+
+            _LOGGER.info(
+                "Oil level %s %s threshold of %s%% (now %s%%)",
+                "dropped below" if is_active else "recovered above",
+                threshold,
+                level,
+                percentage,
+            )
+            self.hass.bus.async_fire(
+                EVENT_THRESHOLD_CROSSED,
+                {
+                    "entry_id": self._entry_id,
+                    ATTR_THRESHOLD: threshold,
+                    ATTR_THRESHOLD_LEVEL: level,
+                    ATTR_HYSTERESIS: self.hysteresis,
+                    "percentage": percentage,
+                    "direction": "below" if is_active else "above",
+                },
+            )
+
+        if changed:
+            async_dispatcher_send(
+                self.hass, SIGNAL_THRESHOLD_UPDATED.format(self._entry_id)
+            )
+
+        return changed
@@ -0,0 +1,49 @@
+"""Fixtures for Heating Oil Level tests."""
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.heating_oil_level.const import (
+    CONF_ENERGY_ENTITY,
+    CONF_KWH_PER_LITRE,
+    CONF_TANK_CAPACITY,
+    DOMAIN,
+)
+
+from .const import ENERGY_ENTITY, KWH_PER_LITRE
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable loading the custom integration in all tests."""
+    yield
+
+
+@pytest.fixture(autouse=True)
+def skip_card_resource_registration():
+    """Don't register the Lovelace card, which retries until lovelace loads."""
+    with patch(
+        "custom_components.heating_oil_level._async_register_card_resource"
+    ):
+        yield
+
+
+@pytest.fixture
+async def tank_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up a tank fed by a mock boiler energy sensor."""
+    hass.states.async_set(ENERGY_ENTITY, "10000.0")
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_ENERGY_ENTITY: ENERGY_ENTITY,
+            CONF_TANK_CAPACITY: 1000,
+            CONF_KWH_PER_LITRE: KWH_PER_LITRE,
+        },
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
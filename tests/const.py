@@ -0,0 +1,4 @@
+"""Constants for Heating Oil Level tests."""
+
+ENERGY_ENTITY = "sensor.boiler_energy"
+KWH_PER_LITRE = 10.0
@@ -0,0 +1,32 @@
+"""Tests for the site aggregate across tanks."""
+from __future__ import annotations
+
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.heating_oil_level.aggregate import SiteAggregate
+
+
+async def test_burn_rate_unknown_until_a_tank_has_one(hass: HomeAssistant) -> None:
+    """Tanks without a burn rate don't make the site report zero consumption."""
+    aggregate = SiteAggregate(hass)
+    aggregate.async_update_tank("tank_a", 500, 1000, None, None)
+    aggregate.async_update_tank("tank_b", 250, 500, None, None)
+
+    assert aggregate.burn_rate is None
+    assert aggregate.percentage == 50.0
+
+    aggregate.async_update_tank("tank_a", 490, 1000, 10.0, datetime(2026, 12, 1))
+    assert aggregate.burn_rate == 10.0
+    assert aggregate.earliest_run_out == datetime(2026, 12, 1)
+
+    aggregate.async_update_tank("tank_b", 245, 500, 0.0, None)
+    assert aggregate.burn_rate == 10.0
+
+    aggregate.async_remove_tank("tank_a")
+    assert aggregate.burn_rate == 0.0
+    assert aggregate.earliest_run_out is None
+
+    aggregate.async_update_tank("tank_b", 245, 500, None, None)
+    assert aggregate.burn_rate is None
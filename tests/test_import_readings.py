@@ -0,0 +1,84 @@
+"""Tests for parsing imported reading files."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.heating_oil_level import _load_readings
+
+
+def test_load_csv_with_byte_order_mark(tmp_path: Path) -> None:
+    """CSV UTF-8 files saved by spreadsheets import with their header intact."""
+    path = tmp_path / "readings.csv"
+    path.write_bytes(
+        "date,litres,energy\r\n2022-10-03,1150,\r\n2022-11-14T09:30:00,820,18342.6\r\n"
+        .encode("utf-8-sig")
+    )
+
+    assert _load_readings(path, 2000) == [
+        {"date": "2022-10-03T00:00:00", "litres": 1150.0, "energy": None},
+        {"date": "2022-11-14T09:30:00", "litres": 820.0, "energy": 18342.6},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("name", "content", "message"),
+    [
+        (
+            "long.csv",
+            'date,litres\n2022-01-01,"' + "x" * 200000 + '"\n',
+            "Invalid reading in long.csv at line 2: field larger than field limit",
+        ),
+        (
+            "extra.csv",
+            "date,litres\n2022-01-01,10,extra\n",
+            "Invalid reading in extra.csv at line 2: row has more columns",
+        ),
+        (
+            "infinite.csv",
+            "date,litres,energy\n2022-01-01,10,inf\n",
+            "Invalid reading in infinite.csv at line 2: energy inf",
+        ),
+        (
+            "negative.csv",
+            "date,litres,energy\n2022-01-01,10,5\n2022-01-02,10,-1\n",
+            "Invalid reading in negative.csv at line 3: energy -1.0",
+        ),
+        (
+            "broken.jsonl",
+            '{"date": "2022-01-01", "litres": 10}\n{broken\n',
+            "Invalid reading in broken.jsonl at line 2:",
+        ),
+        (
+            "missing.json",
+            '[{"date": "2022-01-01", "litres": 10}, {"date": "2022-01-02"}]',
+            "Invalid reading in missing.json at reading 2:",
+        ),
+        (
+            "object.json",
+            '{"date": "2022-01-01", "litres": 10}',
+            "Invalid readings file object.json: JSON file must contain a list",
+        ),
+    ],
+)
+def test_load_invalid_readings(
+    tmp_path: Path, name: str, content: str, message: str
+) -> None:
+    """Invalid files are rejected with the location of the problem."""
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(HomeAssistantError, match=message):
+        _load_readings(path, 2000)
+
+
+def test_load_non_utf8_file(tmp_path: Path) -> None:
+    """A file that isn't UTF-8 is rejected without a misleading line number."""
+    path = tmp_path / "latin.csv"
+    path.write_bytes("date,litres\n2022-01-01,10\n\xe9\n".encode("latin-1"))
+
+    with pytest.raises(HomeAssistantError, match="^latin.csv is not UTF-8 text"):
+        _load_readings(path, 2000)
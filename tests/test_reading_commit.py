@@ -0,0 +1,135 @@
+"""Tests for committing manual readings while energy updates arrive."""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from typing import Any
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.entity_platform import async_get_platforms
+
+from custom_components.heating_oil_level import async_commit_reading
+from custom_components.heating_oil_level.const import DOMAIN
+
+from .const import ENERGY_ENTITY
+
+READINGS = 50
+TICKS_PER_READING = 20
+
+
+def _tank_entities(hass: HomeAssistant, entry: MockConfigEntry, domain: str) -> list:
+    """Return the tank's entities of a platform domain."""
+    return [
+        entity
+        for platform in async_get_platforms(hass, DOMAIN)
+        if platform.domain == domain and platform.config_entry is entry
+        for entity in platform.entities.values()
+    ]
+
+
+async def test_reading_commits_interleaved_with_energy_ticks(
+    hass: HomeAssistant, tank_entry: MockConfigEntry
+) -> None:
+    """Every sensor state matches one committed reading, written once per commit."""
+    entry = tank_entry
+    sensors = _tank_entities(hass, entry, "sensor")
+    (reading_input,) = _tank_entities(hass, entry, "number")
+    assert len(sensors) == 4
+
+    # Count every state write of the tank's sensors
+    writes: Counter[str] = Counter()
+    for sensor in sensors:
+        original_write = sensor.async_write_ha_state
+
+        def counting_write(
+            entity_id: str = sensor.entity_id, write=original_write
+        ) -> None:
+            writes[entity_id] += 1
+            write()
+
+        sensor.async_write_ha_state = counting_write
+
+    # Baselines of every commit, by reading version
+    committed: dict[int, tuple[float, float | None]] = {}
+    commit_writes: list[Counter[str]] = []
+
+    def recording_commit(
+        hass: HomeAssistant, entry_id: str, reading: float, energy: float | None
+    ) -> int:
+        before = writes.copy()
+        version = async_commit_reading(hass, entry_id, reading, energy)
+        commit_writes.append(writes - before)
+        committed[version] = (reading, energy)
+        return version
+
+    # Every state written for the level and percentage sensors
+    observed: list[tuple[str, Any, dict[str, Any]]] = []
+
+    @callback
+    def record_state(event: Event) -> None:
+        new_state = event.data["new_state"]
+        if new_state is not None and new_state.entity_id in (
+            "sensor.heating_oil_tank_oil_level",
+            "sensor.heating_oil_tank_oil_level_percentage",
+        ):
+            observed.append(
+                (new_state.entity_id, new_state.state, dict(new_state.attributes))
+            )
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, record_state)
+
+    async def energy_ticks() -> None:
+        energy = 10000.0
+        for _ in range(READINGS * TICKS_PER_READING):
+            energy += 0.7
+            hass.states.async_set(ENERGY_ENTITY, f"{energy:.1f}")
+            await asyncio.sleep(0)
+
+    async def reading_updates() -> None:
+        for index in range(READINGS):
+            # Each reading is distinct, so states identify their commit
+            await reading_input.async_set_native_value(900.0 - index)
+            for _ in range(TICKS_PER_READING // 2):
+                await asyncio.sleep(0)
+
+    with patch(
+        "custom_components.heating_oil_level.number.async_commit_reading",
+        side_effect=recording_commit,
+    ):
+        await asyncio.gather(energy_ticks(), reading_updates())
+        await hass.async_block_till_done()
+
+    data = hass.data[DOMAIN][entry.entry_id]["data"]
+    assert data["reading_version"] == READINGS
+    assert sorted(committed) == list(range(1, READINGS + 1))
+
+    # Each commit wrote every sensor exactly once
+    assert len(commit_writes) == READINGS
+    for counts in commit_writes:
+        assert counts == Counter({sensor.entity_id: 1 for sensor in sensors})
+
+    # Every observed state belongs to a single committed baseline
+    baselines = set(committed.values())
+    assert observed
+    for entity_id, state, attributes in observed:
+        if attributes["last_reading"] is None:
+            continue
+        baseline = (attributes["last_reading"], attributes["energy_at_reading"])
+        assert baseline in baselines, (entity_id, state, attributes)
+
+        level = max(0, round(attributes["last_reading"] - attributes["oil_consumed"], 2))
+        if entity_id == "sensor.heating_oil_tank_oil_level":
+            assert float(state) == level
+        else:
+            assert attributes["current_level"] == level
+            assert float(state) == round(min(100, max(0, level / 1000 * 100)), 1)
+
+    # The final states reflect the last commit
+    last_reading, last_energy = committed[READINGS]
+    level_state = hass.states.get("sensor.heating_oil_tank_oil_level")
+    assert level_state.attributes["last_reading"] == last_reading
+    assert level_state.attributes["energy_at_reading"] == last_energy
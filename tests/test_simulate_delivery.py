@@ -0,0 +1,43 @@
+"""Tests for the delivery planning simulation service."""
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.heating_oil_level.const import DOMAIN
+
+
+async def test_cached_response_is_not_shared(
+    hass: HomeAssistant, tank_entry: MockConfigEntry
+) -> None:
+    """Changing one response does not change the cached result."""
+    data = hass.data[DOMAIN][tank_entry.entry_id]["data"]
+    data["last_reading"] = 600.0
+    data["daily_consumption"] = [
+        {"date": f"2026-01-{day:02d}", "litres": 10.0} for day in range(1, 15)
+    ]
+
+    service_data = {
+        "entry_id": tank_entry.entry_id,
+        "lead_time": 5,
+        "minimum_level": 100,
+    }
+    first = await hass.services.async_call(
+        DOMAIN, "simulate_delivery", service_data, blocking=True, return_response=True
+    )
+    # Constant use of 10 L/day leaves 500 L above the minimum for 50 days
+    assert first["earliest_at_risk_date"] is not None
+    assert first["order_too_late"] is False
+    assert first["run_low_probability"][48]["probability"] == 0
+    assert first["run_low_probability"][50]["probability"] == 1
+
+    first["recommended_order_date"] = None
+    first["run_low_probability"].clear()
+
+    second = await hass.services.async_call(
+        DOMAIN, "simulate_delivery", service_data, blocking=True, return_response=True
+    )
+    assert second is not first
+    assert second["recommended_order_date"] is not None
+    assert len(second["run_low_probability"]) == 90